@@ -11,6 +11,10 @@ Set-Location ..\chat_backend
 # Copy all static files
 Copy-Item -Path ..\chat_messages\build\web\* -Destination .\static\ -Recurse -Force
 
+# Flutter's generated bootstrap pins the engine revision used to fetch CanvasKit
+$bootstrap = Get-Content -Path ..\chat_messages\build\web\flutter_bootstrap.js -Raw
+$engineRevision = [regex]::Match($bootstrap, '"engineRevision":"([0-9a-f]+)"').Groups[1].Value
+
 # Create Django-compatible index.html in templates
 $indexHtml = @"
 {% load static %}
@@ -32,7 +36,16 @@ $indexHtml = @"
 <body>
   <div id="loading" style="display: flex; justify-content: center; align-items: center; height: 100vh; background-color: #f0f0f0;">
   </div>
-  <script src="{% static 'flutter_bootstrap.js' %}" async></script>
+  <script src="{% static 'flutter.js' %}"></script>
+  <script>
+    // Point the loader at hashed, precompressed files under STATIC_URL
+    _flutter.buildConfig = {"engineRevision":"$engineRevision","builds":[{"compileTarget":"dart2js","renderer":"canvaskit","mainJsPath":"{% static 'main.dart.js' %}"}]};
+    _flutter.loader.load({
+      config: {
+        assetBase: "{% get_static_prefix %}",
+      },
+    });
+  </script>
 </body>
 </html>
 "@
@@ -16,8 +16,11 @@ cp -r ../chat_messages/build/web/* ./static/
 # Copy index.html to templates (will be overwritten with Django template version)
 cp ../chat_messages/build/web/index.html ./templates/index.html
 
+# Flutter's generated bootstrap pins the engine revision used to fetch CanvasKit
+ENGINE_REVISION=$(grep -o '"engineRevision":"[0-9a-f]*"' ../chat_messages/build/web/flutter_bootstrap.js | cut -d'"' -f4)
+
 # Update index.html to use Django static tags
-cat > ./templates/index.html << 'EOF'
+cat > ./templates/index.html << EOF
 {% load static %}
 <!DOCTYPE html>
 <html>
@@ -38,7 +41,16 @@ cat > ./templates/index.html << 'EOF'
   <div id="loading" style="display: flex; justify-content: center; align-items: center; height: 100vh; font-family: sans-serif;">
     <h2>Loading Chat App...</h2>
   </div>
-  <script src="{% static 'flutter_bootstrap.js' %}" async></script>
+  <script src="{% static 'flutter.js' %}"></script>
+  <script>
+    // Point the loader at hashed, precompressed files under STATIC_URL
+    _flutter.buildConfig = {"engineRevision":"${ENGINE_REVISION}","builds":[{"compileTarget":"dart2js","renderer":"canvaskit","mainJsPath":"{% static 'main.dart.js' %}"}]};
+    _flutter.loader.load({
+      config: {
+        assetBase: "{% get_static_prefix %}",
+      },
+    });
+  </script>
 </body>
 </html>
 EOF
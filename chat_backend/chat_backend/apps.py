@@ -0,0 +1,15 @@
+from django.contrib.staticfiles.apps import StaticFilesConfig
+
+
+class FlutterStaticFilesConfig(StaticFilesConfig):
+    # Parts of the Flutter build the Django-served shell never fetches:
+    # CanvasKit comes from gstatic by engine revision, the shell replaces
+    # flutter_bootstrap.js/index.html and registers no service worker.
+    ignore_patterns = StaticFilesConfig.ignore_patterns + [
+        'canvaskit',
+        '*.symbols',
+        'flutter_bootstrap.js',
+        'flutter_service_worker.js',
+        'index.html',
+        'vercel.json',
+    ]
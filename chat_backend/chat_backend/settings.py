@@ -25,7 +25,7 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
-    'django.contrib.staticfiles',
+    'chat_backend.apps.FlutterStaticFilesConfig',
     'rest_framework',
     'rest_framework.authtoken',
     'corsheaders',
@@ -36,7 +36,7 @@ INSTALLED_APPS = [
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
-    # 'whitenoise.middleware.WhiteNoiseMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -142,7 +142,19 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'static'),
 ]
-# STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
+
+# Hashed, gzip + brotli precompressed assets built by `collectstatic`
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'chat_backend.storage.FlutterStaticFilesStorage',
+    },
+}
+# Hashed files are served with an immutable, 10-year Cache-Control; unhashed
+# ones (Flutter's assets/, fetched via assetBase) get a short max-age
+WHITENOISE_MAX_AGE = 0 if DEBUG else 300
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -0,0 +1,24 @@
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class FlutterStaticFilesStorage(CompressedManifestStaticFilesStorage):
+    """
+    Hashed, gzip/brotli precompressed storage for the Flutter web build.
+
+    `flutter build web --release` leaves a `sourceMappingURL=flutter.js.map`
+    comment in the loader scripts without shipping the map, so JS references
+    are not rewritten; only CSS `url()`/`@import` references are hashed.
+    """
+
+    patterns = tuple(
+        (extension, rules)
+        for extension, rules in CompressedManifestStaticFilesStorage.patterns
+        if extension != '*.js'
+    )
+
+    def stored_name(self, name):
+        # Before collectstatic has written a manifest (e.g. a local runserver),
+        # fall back to the unhashed name instead of failing every page render
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
@@ -2,13 +2,14 @@
 from django.contrib import admin
 from django.urls import path, re_path
 from django.urls import include
-from django.views.generic import TemplateView
 from django.conf import settings
 from django.conf.urls.static import static
 
 from rest_framework.schemas import get_schema_view
 from rest_framework.renderers import JSONOpenAPIRenderer
 
+from .views import spa_shell
+
 urlpatterns = [
     path('api/', include('users.urls')),
     # Use built-in DRF schema with JSON-only renderer (no PyYAML needed)
@@ -23,7 +24,7 @@ urlpatterns = [
 
 # Serve Flutter web app for all other routes (SPA routing)
 urlpatterns += [
-    re_path(r'^.*$', TemplateView.as_view(template_name='index.html')),
+    re_path(r'^.*$', spa_shell),
 ]
 
 # Serve static files in development
@@ -0,0 +1,35 @@
+import hashlib
+from functools import lru_cache
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.utils.cache import get_conditional_response, quote_etag
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import require_safe
+
+
+@lru_cache(maxsize=1)
+def _cached_shell():
+    content = render_to_string('index.html').encode()
+    return content, quote_etag(hashlib.md5(content).hexdigest())
+
+
+@require_safe
+@cache_control(no_cache=True)
+def spa_shell(request, *args, **kwargs):
+    """
+    Serve the Flutter SPA shell for all non-API routes.
+
+    The template is rendered once per process (it only resolves hashed
+    static URLs) and browsers revalidate it via ETag, so a deploy with new
+    asset hashes is picked up without re-rendering on every request.
+    """
+    # Re-render on every hit in DEBUG so template edits show up immediately
+    if settings.DEBUG:
+        _cached_shell.cache_clear()
+    content, etag = _cached_shell()
+
+    response = HttpResponse(content, content_type='text/html; charset=utf-8')
+    response['ETag'] = etag
+    return get_conditional_response(request, etag=etag, response=response)